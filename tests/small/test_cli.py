@@ -26,7 +26,8 @@ import os
 import sys
 from ..tools import get_data_dir, change_xdg_path, patchelem
 import umake
-from umake import frameworks
+from umake import frameworks, get_requested_category
+from unittest.mock import patch
 
 
 class TestCLIFromFrameworks(LoggedTestCase):
@@ -44,7 +45,7 @@ class TestCLIFromFrameworks(LoggedTestCase):
 
         with patchelem(umake.frameworks, '__file__', os.path.join(cls.testframeworks_dir, '__init__.py')),\
                 patchelem(umake.frameworks, '__package__', "testframeworks"):
-            frameworks.load_frameworks()
+            frameworks.load_frameworks(force_reload=True)
         # patch the BaseCategory dictionary from the umake.ui.cli one
         umake.ui.cli.BaseCategory = frameworks.BaseCategory
 
@@ -205,3 +206,42 @@ class TestCLIFromFrameworks(LoggedTestCase):
         """We mangle the -r remove option if global (before the category name) to append it to the framework option"""
         self.assertEqual(mangle_args_for_default_framework(["-r", "category-a", "framework-a"]),
                          ["category-a", "framework-a", "-r"])
+
+
+class TestRequestedCategory(LoggedTestCase):
+    """This will test which category is requested on the command line"""
+
+    def setUp(self):
+        super().setUp()
+        patcher = patch('umake.is_completion_mode', return_value=False)
+        self.completion_mode_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_requested_category(self):
+        """The first positional argument is the requested category"""
+        self.assertEqual(get_requested_category(["umake", "android", "android-studio"]), "android")
+
+    def test_requested_category_after_options(self):
+        """Leading options are skipped"""
+        self.assertEqual(get_requested_category(["umake", "-v", "-r", "android", "android-studio"]), "android")
+
+    def test_no_requested_category(self):
+        """No positional argument doesn't request any category"""
+        self.assertIsNone(get_requested_category(["umake", "-v"]))
+
+    def test_no_requested_category_without_args(self):
+        """No argument doesn't request any category"""
+        self.assertIsNone(get_requested_category(["umake"]))
+
+    def test_no_requested_category_for_help(self):
+        """Help needs every category"""
+        self.assertIsNone(get_requested_category(["umake", "android", "--help"]))
+
+    def test_no_requested_category_in_completion_mode(self):
+        """Completion needs every category"""
+        self.completion_mode_mock.return_value = True
+        self.assertIsNone(get_requested_category(["umake", "android"]))
+
+    def test_main_category_framework_requested(self):
+        """A main category framework name is returned as is, it isn't a category module so everything is loaded"""
+        self.assertEqual(get_requested_category(["umake", "-v", "framework-free-a"]), "framework-free-a")
@@ -24,6 +24,7 @@ from contextlib import suppress
 import importlib
 import os
 import shutil
+import subprocess
 import sys
 import tempfile
 from ..data.testframeworks.uninstantiableframework import Uninstantiable, InheritedFromUninstantiable
@@ -32,7 +33,7 @@ import umake
 from umake import frameworks
 from umake.frameworks.baseinstaller import BaseInstaller
 from umake.settings import UMAKE_FRAMEWORKS_ENVIRON_VARIABLE
-from umake.tools import NoneDict, ConfigHandler
+from umake.tools import ConfigHandler, PlatformDetectionError
 from unittest.mock import Mock, patch, call
 from umake.ui.cli import get_frameworks_list_output
 
@@ -54,7 +55,7 @@ class BaseFrameworkLoader(LoggedTestCase):
     def tearDown(self):
         change_xdg_path('XDG_CONFIG_HOME', remove=True)
         # we reset the loaded categories
-        self.CategoryHandler.categories = NoneDict()
+        self.CategoryHandler.categories = {}
         super().tearDown()
 
     def config_dir_for_name(self, name):
@@ -100,7 +101,7 @@ class TestFrameworkLoader(BaseFrameworkLoader):
         # load custom framework-directory
         with patchelem(umake.frameworks, '__file__', os.path.join(self.testframeworks_dir, '__init__.py')),\
                 patchelem(umake.frameworks, '__package__', "testframeworks"):
-            frameworks.load_frameworks(load_user_frameworks=False)
+            frameworks.load_frameworks(load_user_frameworks=False, force_reload=True)
         self.categoryA = self.CategoryHandler.categories["category-a"]
 
     def tearDown(self):
@@ -123,6 +124,13 @@ class TestFrameworkLoader(BaseFrameworkLoader):
         self.assertTrue(len([1 for category in self.CategoryHandler.categories.values()
                              if not category.is_main_category]) > 0, str(self.CategoryHandler.categories.values()))
 
+    def test_load_frameworks_only_once(self):
+        """Loading frameworks again doesn't discover nor register them twice"""
+        with patch('umake.frameworks.load_module') as load_module_mock:
+            frameworks.load_frameworks(load_user_frameworks=False)
+        self.assertFalse(load_module_mock.called)
+        self.assertEqual(self.CategoryHandler.categories["category-a"], self.categoryA)
+
     def test_get_category_by_prog_name(self):
         """categories index returns matching category"""
         category = self.CategoryHandler.categories["category-a"]
@@ -135,7 +143,7 @@ class TestFrameworkLoader(BaseFrameworkLoader):
 
     def test_get_category_not_existing(self):
         """the call to get category returns None when there is no match"""
-        self.assertIsNone(self.CategoryHandler.categories["foo"])
+        self.assertIsNone(self.CategoryHandler.categories.get("foo"))
 
     def test_get_category_prog_name(self):
         """prog_name for category is what we expect"""
@@ -156,7 +164,7 @@ class TestFrameworkLoader(BaseFrameworkLoader):
 
     def test_framework_not_existing(self):
         """the call  to get a framework returns None when there is no match"""
-        self.assertIsNone(self.categoryA.frameworks["foo"])
+        self.assertIsNone(self.categoryA.frameworks.get("foo"))
 
     def test_frameworks_doesn_t_mix(self):
         """Frameworks, even with the same name, don't mix between categories"""
@@ -237,11 +245,11 @@ class TestFrameworkLoader(BaseFrameworkLoader):
 
     def test_unsupported_arch_framework(self):
         """Framework with an unsupported arch isn't registered"""
-        self.assertIsNone(self.CategoryHandler.categories["category-d"].frameworks["framework-a"])
+        self.assertIsNone(self.CategoryHandler.categories["category-d"].frameworks.get("framework-a"))
 
     def test_unsupported_version_framework(self):
         """Framework with an unsupported arch isn't registered"""
-        self.assertIsNone(self.CategoryHandler.categories["category-d"].frameworks["framework-b"])
+        self.assertIsNone(self.CategoryHandler.categories["category-d"].frameworks.get("framework-b"))
 
     def test_child_installable_chained_parent(self):
         """Framework with an is_installable chained to parent"""
@@ -253,7 +261,7 @@ class TestFrameworkLoader(BaseFrameworkLoader):
 
     def test_child_installable_overridden_false(self):
         """Framework with an is_installable override to False from children (with no restrictions)"""
-        self.assertIsNone(self.CategoryHandler.categories["category-e"].frameworks["framework-c"])
+        self.assertIsNone(self.CategoryHandler.categories["category-e"].frameworks.get("framework-c"))
 
     def test_check_not_installed_wrong_path(self):
         """Framework isn't installed path doesn't exist"""
@@ -265,7 +273,7 @@ class TestFrameworkLoader(BaseFrameworkLoader):
 
     def test_check_unmatched_requirements_not_installed(self):
         """Framework with unmatched requirements are not registered"""
-        self.assertIsNone(self.CategoryHandler.categories["category-f"].frameworks["framework-c"])
+        self.assertIsNone(self.CategoryHandler.categories["category-f"].frameworks.get("framework-c"))
 
     def test_no_root_need_if_no_requirements(self):
         """Framework with not requirements don't need root access"""
@@ -273,7 +281,7 @@ class TestFrameworkLoader(BaseFrameworkLoader):
 
     def test_uninstalled_framework_marked_for_removal_only_not_registered(self):
         """Uninstalled framework marked for removal only isn't not registered (as we can't install it back)"""
-        self.assertIsNone(self.CategoryHandler.categories["category-r"].frameworks["framework-r-uninstalled"])
+        self.assertIsNone(self.CategoryHandler.categories["category-r"].frameworks.get("framework-r-uninstalled"))
 
     def test_installed_framework_not_installable_registered(self):
         """Installed framework not installable are still registered (can be used for removal)"""
@@ -358,6 +366,16 @@ class TestFrameworkLoader(BaseFrameworkLoader):
         self.assertRaises(BaseException, self.CategoryHandler.categories[args.category].run_for, args)
         self.expect_warn_error = True
 
+    def test_run_for_unknown_framework_returns_error(self):
+        """Running an unknown framework of a category returns an error"""
+        args = Mock()
+        args.category = "category-a"
+        args.framework = "foo"
+        with patch('umake.frameworks.UI') as UIMock:
+            self.CategoryHandler.categories[args.category].run_for(args)
+        UIMock.return_main_screen.assert_called_with(status_code=2)
+        self.expect_warn_error = True
+
     def test_parse_category_and_framework_cannot_run_remove_with_destdir_framework(self):
         """Parsing category and framework with remove and destdir raises an error"""
         args = Mock()
@@ -472,7 +490,7 @@ class TestFrameworkLoaderWithValidConfig(BaseFrameworkLoader):
         # load custom framework-directory
         with patchelem(umake.frameworks, '__file__', os.path.join(self.testframeworks_dir, '__init__.py')),\
                 patchelem(umake.frameworks, '__package__', "testframeworks"):
-            frameworks.load_frameworks(load_user_frameworks=False)
+            frameworks.load_frameworks(load_user_frameworks=False, force_reload=True)
         self.categoryA = self.CategoryHandler.categories["category-a"]
 
     def tearDown(self):
@@ -511,7 +529,7 @@ class TestFrameworkLoaderSaveConfig(BaseFrameworkLoader):
         # load custom framework-directory
         with patchelem(umake.frameworks, '__file__', os.path.join(self.testframeworks_dir, '__init__.py')),\
                 patchelem(umake.frameworks, '__package__', "testframeworks"):
-            frameworks.load_frameworks(load_user_frameworks=False)
+            frameworks.load_frameworks(load_user_frameworks=False, force_reload=True)
         self.categoryA = self.CategoryHandler.categories["category-a"]
         self.config_dir = tempfile.mkdtemp()
         change_xdg_path('XDG_CONFIG_HOME', self.config_dir)
@@ -608,7 +626,7 @@ class TestFrameworkLoadOnDemandLoader(BaseFrameworkLoader):
         """Load framework name"""
         with patchelem(umake.frameworks, '__file__', os.path.join(self.testframeworks_dir, '__init__.py')),\
                 patchelem(umake.frameworks, '__package__', framework_name):
-            frameworks.load_frameworks(load_user_frameworks=False)
+            frameworks.load_frameworks(load_user_frameworks=False, force_reload=True)
 
     def install_category_parser(self, main_parser, categories=[]):
         """Install parser for those categories"""
@@ -624,11 +642,11 @@ class TestFrameworkLoadOnDemandLoader(BaseFrameworkLoader):
 
     def test_arch_report_issue_framework(self):
         """Framework where we can't reach arch and having a restriction isn't installable"""
-        self.get_current_arch_mock.side_effect = BaseException('arch detection failure!')
+        self.get_current_arch_mock.side_effect = subprocess.CalledProcessError(2, 'dpkg')
         self.loadFramework("testframeworks")
 
         # restricted arch framework isn't installable
-        self.assertIsNone(self.CategoryHandler.categories["category-d"].frameworks["framework-a"])
+        self.assertIsNone(self.CategoryHandler.categories["category-d"].frameworks.get("framework-a"))
         # framework with no arch restriction but others are still installable
         self.assertTrue(self.CategoryHandler.categories["category-d"].frameworks["framework-b"].is_installable)
         # framework without any restriction is still installable
@@ -637,20 +655,34 @@ class TestFrameworkLoadOnDemandLoader(BaseFrameworkLoader):
 
     def test_version_report_issue_framework(self):
         """Framework where we can't reach version and having a restriction isn't installable"""
-        self.get_current_distro_version_mock.side_effect = BaseException('version detection failure!')
+        self.get_current_distro_version_mock.side_effect = PlatformDetectionError('version detection failure!')
         self.loadFramework("testframeworks")
 
         # restricted version framework isn't installable
-        self.assertIsNone(self.CategoryHandler.categories["category-d"].frameworks["framework-b"])
+        self.assertIsNone(self.CategoryHandler.categories["category-d"].frameworks.get("framework-b"))
         # framework with no version restriction but others are still installable
         self.assertTrue(self.CategoryHandler.categories["category-d"].frameworks["framework-a"].is_installable)
         # framework without any restriction is still installable
         self.assertTrue(self.CategoryHandler.categories["category-a"].frameworks["framework-a"].is_installable)
         self.expect_warn_error = True
 
+    def test_unexpected_error_when_detecting_platform_is_raised(self):
+        """Unexpected errors when checking if a framework is installable aren't swallowed"""
+        self.get_current_distro_version_mock.side_effect = ValueError('unexpected failure!')
+        self.assertRaises(ValueError, self.loadFramework, "testframeworks")
+
+    def test_load_main_category_framework_requested(self):
+        """Requesting a main category framework still loads it with every category"""
+        with patchelem(umake.frameworks, '__file__', os.path.join(self.testframeworks_dir, '__init__.py')),\
+                patchelem(umake.frameworks, '__package__', "testframeworks"):
+            frameworks.load_frameworks(load_user_frameworks=False, force_reload=True,
+                                       requested_category="framework-free-a")
+        self.assertIn("framework-free-a", self.CategoryHandler.main_category.frameworks)
+        self.assertIn("category-a", self.CategoryHandler.categories)
+
     def test_check_not_installed_wrong_requirements(self):
         """Framework isn't installed if path and package requirements aren't met"""
-        with patch('umake.frameworks.RequirementsHandler') as requirement_mock:
+        with patch('umake.network.requirements_handler.RequirementsHandler') as requirement_mock:
             requirement_mock.return_value.is_bucket_installed.return_value = False
             self.loadFramework("testframeworks")
             self.assertFalse(self.CategoryHandler.categories["category-f"].frameworks["framework-c"].is_installed)
@@ -660,7 +692,7 @@ class TestFrameworkLoadOnDemandLoader(BaseFrameworkLoader):
 
     def test_check_installed_with_matched_requirements(self):
         """Framework is installed if path and package requirements are met"""
-        with patch('umake.frameworks.RequirementsHandler') as requirement_mock:
+        with patch('umake.network.requirements_handler.RequirementsHandler') as requirement_mock:
             requirement_mock.return_value.is_bucket_installed.return_value = True
             self.loadFramework("testframeworks")
             self.assertTrue(self.CategoryHandler.categories["category-f"].frameworks["framework-c"].is_installed)
@@ -670,28 +702,28 @@ class TestFrameworkLoadOnDemandLoader(BaseFrameworkLoader):
 
     def test_check_requirements_inherited_from_category(self):
         """Framework without package requirements are inherited from category"""
-        with patch('umake.frameworks.RequirementsHandler') as requirement_mock:
+        with patch('umake.network.requirements_handler.RequirementsHandler') as requirement_mock:
             self.loadFramework("testframeworks")
             self.assertEqual(self.CategoryHandler.categories["category-g"].frameworks["framework-b"]
                              .packages_requirements, ["baz"])
 
     def test_check_requirements_from_category_merge_into_exiting(self):
         """Framework with package requirements merged them from the associated category"""
-        with patch('umake.frameworks.RequirementsHandler') as requirement_mock:
+        with patch('umake.network.requirements_handler.RequirementsHandler') as requirement_mock:
             self.loadFramework("testframeworks")
             self.assertEqual(self.CategoryHandler.categories["category-g"].frameworks["framework-a"]
                              .packages_requirements, ["buz", "biz", "baz"])
 
     def test_root_needed_if_not_matched_requirements(self):
         """Framework with unmatched requirements need root access"""
-        with patch('umake.frameworks.RequirementsHandler') as requirement_mock:
+        with patch('umake.network.requirements_handler.RequirementsHandler') as requirement_mock:
             requirement_mock.return_value.is_bucket_installed.return_value = False
             self.loadFramework("testframeworks")
             self.assertTrue(self.CategoryHandler.categories["category-f"].frameworks["framework-c"].need_root_access)
 
     def test_no_root_needed_if_matched_requirements_even_uninstalled(self):
         """Framework which are uninstalled but with matched requirements doesn't need root access"""
-        with patch('umake.frameworks.RequirementsHandler') as requirement_mock:
+        with patch('umake.network.requirements_handler.RequirementsHandler') as requirement_mock:
             requirement_mock.return_value.is_bucket_installed.return_value = True
             self.loadFramework("testframeworks")
             # ensure the framework isn't installed, but the bucket being installed, we don't need root access
@@ -703,7 +735,7 @@ class TestFrameworkLoadOnDemandLoader(BaseFrameworkLoader):
         with patch('umake.frameworks.subprocess') as subprocess_mock,\
                 patch.object(umake.frameworks.os, 'geteuid', return_value=1000) as geteuid,\
                 patch('umake.frameworks.MainLoop') as mainloop_mock,\
-                patch('umake.frameworks.RequirementsHandler') as requirement_mock:
+                patch('umake.network.requirements_handler.RequirementsHandler') as requirement_mock:
             requirement_mock.return_value.is_bucket_installed.return_value = False
             self.loadFramework("testframeworks")
             self.assertTrue(self.CategoryHandler.categories["category-f"].frameworks["framework-c"].need_root_access)
@@ -717,7 +749,7 @@ class TestFrameworkLoadOnDemandLoader(BaseFrameworkLoader):
         with patch('umake.frameworks.subprocess') as subprocess_mock,\
                 patch.object(umake.frameworks.os, 'geteuid', return_value=1000) as geteuid,\
                 patch.object(umake.frameworks.sys, 'exit', return_value=True) as sys_exit_mock,\
-                patch('umake.frameworks.RequirementsHandler') as requirement_mock:
+                patch('umake.network.requirements_handler.RequirementsHandler') as requirement_mock:
             requirement_mock.return_value.is_bucket_installed.return_value = True
             self.loadFramework("testframeworks")
             self.assertFalse(self.CategoryHandler.categories["category-f"].frameworks["framework-c"].need_root_access)
@@ -731,7 +763,7 @@ class TestFrameworkLoadOnDemandLoader(BaseFrameworkLoader):
         with patch('umake.frameworks.subprocess') as subprocess_mock,\
                 patch.object(umake.frameworks.sys, 'exit', return_value=True) as sys_exit_mock,\
                 patch.object(umake.frameworks.os, 'geteuid', return_value=0) as geteuid,\
-                patch('umake.frameworks.RequirementsHandler') as requirement_mock,\
+                patch('umake.network.requirements_handler.RequirementsHandler') as requirement_mock,\
                 patch('umake.frameworks.switch_to_current_user') as switch_to_current_use_mock:
             requirement_mock.return_value.is_bucket_installed.return_value = False
             self.loadFramework("testframeworks")
@@ -748,7 +780,7 @@ class TestFrameworkLoadOnDemandLoader(BaseFrameworkLoader):
 
         (so read config)"""
         with patch('umake.frameworks.ConfigHandler') as config_handler_mock,\
-                patch('umake.frameworks.RequirementsHandler') as requirementhandler_mock,\
+                patch('umake.network.requirements_handler.RequirementsHandler') as requirementhandler_mock,\
                 patch('umake.frameworks.is_completion_mode') as completionmode_mock:
             completionmode_mock.return_value = True
             self.loadFramework("testframeworks")
@@ -758,10 +790,23 @@ class TestFrameworkLoadOnDemandLoader(BaseFrameworkLoader):
             # test that a non installed framework is registered
             self.assertIsNotNone(self.CategoryHandler.categories["category-e"].frameworks["framework-c"])
 
+    def test_completion_mode_installed_installable_dont_use_expensive_calls(self):
+        """Completion mode doesn't check requirements when asking if a framework is installed or installable"""
+        with patch('umake.network.requirements_handler.RequirementsHandler') as requirementhandler_mock,\
+                patch('umake.frameworks.is_completion_mode') as completionmode_mock:
+            completionmode_mock.return_value = True
+            self.loadFramework("testframeworks")
+            framework = self.CategoryHandler.categories["category-f"].frameworks["framework-c"]
+
+            self.assertTrue(framework.is_installed)
+            self.assertTrue(framework.is_installable)
+            self.assertFalse(requirementhandler_mock.return_value.is_bucket_installed.called)
+            self.assertFalse(requirementhandler_mock.return_value.is_bucket_available.called)
+
     def test_use_expensive_calls_when_not_in_completion_mode(self):
         """Non completion mode have expensive calls and don't register all frameworks"""
         with patch('umake.frameworks.ConfigHandler') as config_handler_mock,\
-                patch('umake.frameworks.RequirementsHandler') as requirementhandler_mock,\
+                patch('umake.network.requirements_handler.RequirementsHandler') as requirementhandler_mock,\
                 patch('umake.frameworks.is_completion_mode') as completionmode_mock:
             completionmode_mock.return_value = False
             self.loadFramework("testframeworks")
@@ -771,7 +816,7 @@ class TestFrameworkLoadOnDemandLoader(BaseFrameworkLoader):
                             str(config_handler_mock.return_value.config.mock_calls))
             self.assertTrue(requirementhandler_mock.return_value.is_bucket_installed.called)
             # test that a non installed framework is registered
-            self.assertIsNone(self.CategoryHandler.categories["category-e"].frameworks["framework-c"])
+            self.assertIsNone(self.CategoryHandler.categories["category-e"].frameworks.get("framework-c"))
 
     def test_install_category_and_framework_parsers(self):
         """Install category and framework parsers contains works"""
@@ -899,7 +944,7 @@ class TestEmptyFrameworkLoader(BaseFrameworkLoader):
         # load custom unexisting framework-directory
         with patchelem(umake.frameworks, '__file__', os.path.join(self.testframeworks_dir, '__init__.py')),\
                 patchelem(umake.frameworks, '__package__', "testframeworksdoesntexist"):
-            frameworks.load_frameworks(load_user_frameworks=False)
+            frameworks.load_frameworks(load_user_frameworks=False, force_reload=True)
 
     def test_invalid_framework(self):
         """There is one main category, but nothing else"""
@@ -936,7 +981,7 @@ class TestDuplicatedFrameworkLoader(BaseFrameworkLoader):
         super().setUp()
         with patchelem(umake.frameworks, '__file__', os.path.join(self.testframeworks_dir, '__init__.py')),\
                 patchelem(umake.frameworks, '__package__', "duplicatedframeworks"):
-            frameworks.load_frameworks(load_user_frameworks=False)
+            frameworks.load_frameworks(load_user_frameworks=False, force_reload=True)
         self.categoryA = self.CategoryHandler.categories["category-a"]
         self.expect_warn_error = True  # as we load multiple duplicate categories and frameworks
 
@@ -974,7 +1019,7 @@ class TestMultipleDefaultFrameworkLoader(BaseFrameworkLoader):
         super().setUp()
         with patchelem(umake.frameworks, '__file__', os.path.join(self.testframeworks_dir, '__init__.py')),\
                 patchelem(umake.frameworks, '__package__', "multipledefaultsframeworks"):
-            frameworks.load_frameworks(load_user_frameworks=False)
+            frameworks.load_frameworks(load_user_frameworks=False, force_reload=True)
         self.categoryA = self.CategoryHandler.categories["category-a"]
         self.expect_warn_error = True  # as we load multiple default frameworks in a category
 
@@ -1025,7 +1070,7 @@ class TestAbstractFrameworkLoader(BaseFrameworkLoader):
         # load custom unexisting framework-directory
         with patchelem(umake.frameworks, '__file__', os.path.join(self.testframeworks_dir, '__init__.py')),\
                 patchelem(umake.frameworks, '__package__', "abstractframeworks"):
-            frameworks.load_frameworks(load_user_frameworks=False)
+            frameworks.load_frameworks(load_user_frameworks=False, force_reload=True)
         self.categoryA = self.CategoryHandler.categories["category-a"]
 
     def test_load(self):
@@ -1052,7 +1097,7 @@ class TestInvalidFrameworksLoader(BaseFrameworkLoader):
         """Frameworks that don't have a Framework type aren't loaded"""
         with patchelem(umake.frameworks, '__file__', os.path.join(self.testframeworks_dir, '__init__.py')),\
                 patchelem(umake.frameworks, '__package__', "invalidframeworks"):
-            frameworks.load_frameworks(load_user_frameworks=False)
+            frameworks.load_frameworks(load_user_frameworks=False, force_reload=True)
         self.assertEqual(len(self.CategoryHandler.categories["category-a"].frameworks), 0,
                          self.CategoryHandler.categories["category-a"].frameworks)
 
@@ -1065,7 +1110,7 @@ class TestInvalidFrameworksLoader(BaseFrameworkLoader):
             # load home framework-directory
             with patchelem(umake.frameworks, '__file__', os.path.join(self.testframeworks_dir, '__init__.py')),\
                     patchelem(umake.frameworks, '__package__', "invalidframeworks"):
-                frameworks.load_frameworks(load_user_frameworks=False)
+                frameworks.load_frameworks(load_user_frameworks=False, force_reload=True)
 
             args = Mock()
             args.list = False
@@ -1082,7 +1127,7 @@ class TestInvalidFrameworksLoader(BaseFrameworkLoader):
             # load home framework-directory
             with patchelem(umake.frameworks, '__file__', os.path.join(self.testframeworks_dir, '__init__.py')),\
                     patchelem(umake.frameworks, '__package__', "invalidframeworks"):
-                frameworks.load_frameworks(load_user_frameworks=False)
+                frameworks.load_frameworks(load_user_frameworks=False, force_reload=True)
 
             args = Mock()
             args.list = True
@@ -1099,7 +1144,7 @@ class TestInvalidFrameworksLoader(BaseFrameworkLoader):
             # load home framework-directory
             with patchelem(umake.frameworks, '__file__', os.path.join(self.testframeworks_dir, '__init__.py')),\
                     patchelem(umake.frameworks, '__package__', "invalidframeworks"):
-                frameworks.load_frameworks(load_user_frameworks=False)
+                frameworks.load_frameworks(load_user_frameworks=False, force_reload=True)
 
             args = Mock()
             args.list = False
@@ -1151,13 +1196,30 @@ class TestFrameworkLoaderCustom(BaseFrameworkLoader):
         # load home framework-directory
         with patchelem(umake.frameworks, '__file__', os.path.join(self.testframeworks_dir, '__init__.py')),\
                 patchelem(umake.frameworks, '__package__', "testframeworks"):
-            frameworks.load_frameworks()
+            frameworks.load_frameworks(force_reload=True)
 
         # ensure that the overlay is loaded
         self.assertEqual(self.CategoryHandler.categories["category-a-overlay"].name, "Category A overlay")
         # ensure that the other frameworks are still loaded
         self.assertEqual(self.CategoryHandler.categories["category-a"].name, "Category A")
 
+    @patch("umake.frameworks.get_user_frameworks_path")
+    def test_frameworks_registered_in_class_name_order(self, get_user_frameworks_path):
+        """Frameworks of a module are registered in their class name order, not in their definition one"""
+        temp_path = tempfile.mkdtemp()
+        self.dirs_to_remove.append(temp_path)
+        shutil.copy(os.path.join(get_data_dir(), "overlayframeworks", "unorderedframeworks.py"), temp_path)
+        get_user_frameworks_path.return_value = temp_path
+        with patchelem(umake.frameworks, '__file__', os.path.join(self.testframeworks_dir, '__init__.py')),\
+                patchelem(umake.frameworks, '__package__', "testframeworks"):
+            frameworks.load_frameworks(force_reload=True)
+
+        category = self.CategoryHandler.categories["unordered-category"]
+        self.assertEqual(list(category.frameworks), ["framework-a", "framework-b", "framework-c"])
+        # the first class by name wins on duplicated framework names
+        self.assertEqual(category.frameworks["framework-c"].description, "Description for framework C")
+        self.expect_warn_error = True  # expect error due to duplication
+
     def test_load_additional_frameworks_with_env_var(self):
         """Ensure we load additional frameworks set in an environment variable"""
         temp_path = tempfile.mkdtemp()
@@ -1167,7 +1229,7 @@ class TestFrameworkLoaderCustom(BaseFrameworkLoader):
         # load env framework-directory
         with patchelem(umake.frameworks, '__file__', os.path.join(self.testframeworks_dir, '__init__.py')),\
                 patchelem(umake.frameworks, '__package__', "testframeworks"):
-            frameworks.load_frameworks()
+            frameworks.load_frameworks(force_reload=True)
 
         # ensure that the overlay is loaded
         self.assertEqual(self.CategoryHandler.categories["category-a-overlay"].name, "Category A overlay")
@@ -1185,7 +1247,7 @@ class TestFrameworkLoaderCustom(BaseFrameworkLoader):
         # load home framework-directory
         with patchelem(umake.frameworks, '__file__', os.path.join(self.testframeworks_dir, '__init__.py')),\
                 patchelem(umake.frameworks, '__package__', "testframeworks"):
-            frameworks.load_frameworks()
+            frameworks.load_frameworks(force_reload=True)
 
         # ensure that both overlay are loaded
         self.assertEqual(self.CategoryHandler.categories["category-a-overlay"].name, "Category A overlay")
@@ -1203,7 +1265,7 @@ class TestFrameworkLoaderCustom(BaseFrameworkLoader):
         # load home framework-directory
         with patchelem(umake.frameworks, '__file__', os.path.join(self.testframeworks_dir, '__init__.py')),\
                 patchelem(umake.frameworks, '__package__', "testframeworks"):
-            frameworks.load_frameworks()
+            frameworks.load_frameworks(force_reload=True)
 
         # ensure that the duplicated filename (but not category) is loaded
         self.assertEqual(self.CategoryHandler.categories["category-a-overlay"].name, "Category A overlay")
@@ -1220,7 +1282,7 @@ class TestFrameworkLoaderCustom(BaseFrameworkLoader):
         # load home framework-directory
         with patchelem(umake.frameworks, '__file__', os.path.join(self.testframeworks_dir, '__init__.py')),\
                 patchelem(umake.frameworks, '__package__', "testframeworks"):
-            frameworks.load_frameworks()
+            frameworks.load_frameworks(force_reload=True)
 
         # ensure that the overlay one is loaded
         categoryA = self.CategoryHandler.categories["category-a"]
@@ -1246,7 +1308,7 @@ class TestFrameworkLoaderCustom(BaseFrameworkLoader):
         # load env and home framework-directory
         with patchelem(umake.frameworks, '__file__', os.path.join(self.testframeworks_dir, '__init__.py')),\
                 patchelem(umake.frameworks, '__package__', "testframeworks"):
-            frameworks.load_frameworks()
+            frameworks.load_frameworks(force_reload=True)
 
         # ensure that the env overlay one is loaded
         categoryA = self.CategoryHandler.categories["category-a"]
@@ -1262,7 +1324,7 @@ class TestProductionFrameworkLoader(BaseFrameworkLoader):
 
     def test_load_scala(self):
         """Can load production frameworks"""
-        frameworks.load_frameworks(load_user_frameworks=False)
+        frameworks.load_frameworks(load_user_frameworks=False, force_reload=True)
         self.assertTrue(len(self.CategoryHandler.categories) > 0, str(self.CategoryHandler.categories))
         self.assertIsNotNone(self.CategoryHandler.main_category)
         self.assertEqual(len(self.CategoryHandler.categories["scala"].frameworks), 1,
@@ -1270,9 +1332,28 @@ class TestProductionFrameworkLoader(BaseFrameworkLoader):
 
     def test_ignored_frameworks(self):
         """Ignored frameworks aren't loaded"""
-        frameworks.load_frameworks(load_user_frameworks=False)
+        frameworks.load_frameworks(load_user_frameworks=False, force_reload=True)
         self.assertNotIn(BaseInstaller, frameworks.BaseCategory.main_category.frameworks.values())
 
+    def test_load_requested_category_only(self):
+        """Only the requested category frameworks module is loaded"""
+        frameworks.load_frameworks(load_user_frameworks=False, force_reload=True, requested_category="scala")
+        self.assertEqual(sorted(self.CategoryHandler.categories), ["main", "scala"])
+        self.assertEqual(len(self.CategoryHandler.categories["scala"].frameworks), 1,
+                         str(self.CategoryHandler.categories["scala"].frameworks))
+
+    def test_load_all_for_unknown_requested_category(self):
+        """Every frameworks module is loaded if the requested category isn't a frameworks module"""
+        frameworks.load_frameworks(load_user_frameworks=False, force_reload=True, requested_category="foo")
+        self.assertIn("scala", self.CategoryHandler.categories)
+        self.assertIn("android", self.CategoryHandler.categories)
+
+    def test_load_all_for_requested_frameworks_module_not_a_category(self):
+        """Every frameworks module is loaded if the requested frameworks module doesn't provide that category"""
+        frameworks.load_frameworks(load_user_frameworks=False, force_reload=True, requested_category="baseinstaller")
+        self.assertIn("scala", self.CategoryHandler.categories)
+        self.assertIn("android", self.CategoryHandler.categories)
+
 
 class TestCustomFrameworkCantLoad(BaseFrameworkLoader):
     """Get custom unloadable automatically frameworks to test custom corner cases"""
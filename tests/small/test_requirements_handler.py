@@ -544,3 +544,40 @@ class TestRequirementsHandler(DpkgAptSetup):
         self.handler.cache.open()
         self.assertTrue(self.handler.is_bucket_available(test_bucket))
         self.assertEqual(test_bucket, ['testpackage1', 'testpackage'])
+
+    def test_bucket_status_cached(self):
+        """Bucket status is only computed once for the same apt cache state"""
+        self.assertFalse(self.handler.is_bucket_installed(["testpackage"]))
+        self.assertTrue(self.handler.is_bucket_available(["testpackage"]))
+        with patch.object(self.handler, "_is_bucket_installed") as installed_mock,\
+                patch.object(self.handler, "_is_bucket_available") as available_mock:
+            self.assertFalse(self.handler.is_bucket_installed(["testpackage"]))
+            self.assertTrue(self.handler.is_bucket_available(["testpackage"]))
+            self.assertFalse(installed_mock.called)
+            self.assertFalse(available_mock.called)
+
+    def test_bucket_status_refreshed_on_cache_reopen(self):
+        """Bucket status is computed again once the apt cache is reopened"""
+        self.assertFalse(self.handler.is_bucket_installed(["testpackage"]))
+        shutil.copy(os.path.join(self.apt_status_dir, "testpackage_installed_dpkg_status"),
+                    os.path.join(self.dpkg_dir, "status"))
+        self.handler.cache.open()
+        self.assertTrue(self.handler.is_bucket_installed(["testpackage"]))
+
+    def test_or_option_cached_status_selects_alternative(self):
+        """Bucket with alternatives get the same selected package when their status is cached"""
+        self.handler.cache.open()
+        self.assertTrue(self.handler.is_bucket_available(["testpackage42 | testpackage"]))
+        test_bucket = ["testpackage42 | testpackage"]
+        self.assertTrue(self.handler.is_bucket_available(test_bucket))
+        self.assertEqual(test_bucket, ['testpackage'])
+
+    def test_installed_bucket_status_is_available(self):
+        """Installed bucket is known to be available without checking again"""
+        shutil.copy(os.path.join(self.apt_status_dir, "testpackage_installed_dpkg_status"),
+                    os.path.join(self.dpkg_dir, "status"))
+        self.handler.cache.open()
+        self.assertTrue(self.handler.is_bucket_installed(["testpackage"]))
+        with patch.object(self.handler, "_is_bucket_available") as available_mock:
+            self.assertTrue(self.handler.is_bucket_available(["testpackage"]))
+            self.assertFalse(available_mock.called)
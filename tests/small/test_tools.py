@@ -110,6 +110,55 @@ class TestConfigHandler(LoggedTestCase):
         with open(os.path.join(self.config_dir, settings.CONFIG_FILENAME)) as f:
             self.assertEqual(f.read(), 'foo: bar\n')
 
+    def test_save_config_leaves_only_config_file(self):
+        """Saving the config doesn't leave any temporary file behind"""
+        ConfigHandler().config = {'foo': 'bar'}
+
+        self.assertEqual(os.listdir(self.config_dir), [settings.CONFIG_FILENAME])
+
+    def test_save_config_keeps_permissions(self):
+        """Replacing an existing config keeps its permissions"""
+        config_file = os.path.join(self.config_dir, settings.CONFIG_FILENAME)
+        shutil.copy(os.path.join(self.config_dir_for_name('valid'), settings.CONFIG_FILENAME), config_file)
+        os.chmod(config_file, 0o600)
+        ConfigHandler().config = {'foo': 'bar'}
+
+        self.assertEqual(os.stat(config_file).st_mode & 0o777, 0o600)
+
+    def test_save_new_config_follows_umask(self):
+        """A new config is created with permissions from the current umask"""
+        previous_umask = os.umask(0o077)
+        self.addCleanup(os.umask, previous_umask)
+        ConfigHandler().config = {'foo': 'bar'}
+
+        self.assertEqual(os.stat(os.path.join(self.config_dir, settings.CONFIG_FILENAME)).st_mode & 0o777, 0o600)
+
+    def test_save_config_through_symlink(self):
+        """Saving a symlinked config updates the link target and keeps the link"""
+        target_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, target_dir)
+        target_file = os.path.join(target_dir, settings.CONFIG_FILENAME)
+        shutil.copy(os.path.join(self.config_dir_for_name('valid'), settings.CONFIG_FILENAME), target_file)
+        config_file = os.path.join(self.config_dir, settings.CONFIG_FILENAME)
+        os.symlink(target_file, config_file)
+        ConfigHandler().config = {'foo': 'bar'}
+
+        self.assertTrue(os.path.islink(config_file))
+        with open(target_file) as f:
+            self.assertEqual(f.read(), 'foo: bar\n')
+        self.assertEqual(os.listdir(target_dir), [settings.CONFIG_FILENAME])
+
+    def test_save_config_failure_leaves_no_temporary_file(self):
+        """A failure while saving the config doesn't leave any temporary file behind nor touch the existing one"""
+        shutil.copy(os.path.join(self.config_dir_for_name('valid'), settings.CONFIG_FILENAME), self.config_dir)
+        with patch("umake.tools.yaml.dump", side_effect=OSError("dump failure")):
+            with self.assertRaises(OSError):
+                ConfigHandler().config = {'foo': 'bar'}
+
+        self.assertEqual(os.listdir(self.config_dir), [settings.CONFIG_FILENAME])
+        self.assertEqual(ConfigHandler().config['frameworks']['category-a']['framework-a'],
+                         {'path': '/home/didrocks/quickly/ubuntu-make/adt-eclipse'})
+
     def test_dont_create_file_without_assignment(self):
         """We don't create any file without an assignment"""
         ConfigHandler()
@@ -26,7 +26,7 @@ import logging.config
 import os
 import sys
 from umake.frameworks import load_frameworks
-from umake.tools import MainLoop
+from umake.tools import MainLoop, is_completion_mode
 from .ui import cli
 import yaml
 
@@ -101,6 +101,17 @@ def should_load_all_frameworks(args):
     return False
 
 
+def get_requested_category(args):
+    """Return the category requested on the command line if only its frameworks need to be loaded, None otherwise"""
+    # completion and help need every framework
+    if is_completion_mode() or "--help" in args:
+        return None
+    for arg in args[1:]:
+        if not arg.startswith('-'):
+            return arg
+    return None
+
+
 class _HelpAction(argparse._HelpAction):
 
     def __call__(self, parser, namespace, values, option_string=None):
@@ -146,7 +157,10 @@ def main():
     mainloop = MainLoop()
 
     # load frameworks
-    load_frameworks(force_loading=should_load_all_frameworks(sys.argv))
+    if should_load_all_frameworks(sys.argv):
+        load_frameworks(force_loading=True)
+    else:
+        load_frameworks(requested_category=get_requested_category(sys.argv))
 
     # initialize parser
     cli.main(parser)
@@ -30,55 +30,53 @@ import os
 import pkgutil
 import sys
 import subprocess
-from umake.network.requirements_handler import RequirementsHandler
 from umake.settings import DEFAULT_INSTALL_TOOLS_PATH, UMAKE_FRAMEWORKS_ENVIRON_VARIABLE, DEFAULT_BINARY_LINK_PATH
-from umake.tools import ConfigHandler, NoneDict, classproperty, get_current_arch, get_current_distro_version,\
+from umake.tools import ConfigHandler, get_current_arch, get_current_distro_version, PlatformDetectionError,\
     is_completion_mode, switch_to_current_user, MainLoop, get_user_frameworks_path, get_current_distro_id
 from umake.ui import UI
 
 
 logger = logging.getLogger(__name__)
 
+# frameworks are only discovered and loaded once per process
+_loaded = False
+
+# programmatic, path and CLI compatible names don't have any / or space
+_PROG_NAME_TRANS = str.maketrans("/ ", "--")
+
 
 class BaseCategory():
     """Base Category class to be inherited"""
 
     NOT_INSTALLED, PARTIALLY_INSTALLED, FULLY_INSTALLED = range(3)
-    categories = NoneDict()
+    categories = {}
+    main_category = None
 
     def __init__(self, name, description="", logo_path=None, is_main_category=False, packages_requirements=None):
         self.name = name
+        # programmatic, path and CLI compatible name
+        self.prog_name = name.lower().translate(_PROG_NAME_TRANS)
+        # default frameworks install dir prefix, relative to DEFAULT_INSTALL_TOOLS_PATH
+        self.install_path_dir_prefix = "" if is_main_category else self.prog_name + os.sep
         self.description = description
         self.logo_path = logo_path
         self.is_main_category = is_main_category
         self.default = None
-        self.frameworks = NoneDict()
+        self.frameworks = {}
+        self._default_framework = None
         self.packages_requirements = [] if packages_requirements is None else packages_requirements
         if self.prog_name in self.categories:
             logger.warning("There is already a registered category with {} as a name. Don't register the second one."
                            .format(name))
         else:
             self.categories[self.prog_name] = self
-
-    @classproperty
-    def main_category(self):
-        for category in self.categories.values():
-            if category.is_main_category:
-                return category
-        return None
-
-    @property
-    def prog_name(self):
-        """Get programmatic, path and CLI compatible names"""
-        return self.name.lower().replace('/', '-').replace(' ', '-')
+            if is_main_category:
+                BaseCategory.main_category = self
 
     @property
     def default_framework(self):
         """Get default framework"""
-        for framework in self.frameworks.values():
-            if framework.is_category_default:
-                return framework
-        return None
+        return self._default_framework
 
     def register_framework(self, framework):
         """Register a new framework"""
@@ -87,21 +85,29 @@ class BaseCategory():
                          .format(framework.name))
         else:
             self.frameworks[framework.prog_name] = framework
+            if framework.is_category_default:
+                self._default_framework = framework
+
+    def unset_default_framework(self):
+        """Unset current default framework, if any"""
+        if self._default_framework is not None:
+            self._default_framework.is_category_default = False
+            self._default_framework = None
 
     @property
     def is_installed(self):
         """Return if the category is installed"""
-        installed_frameworks = [framework for framework in self.frameworks.values() if framework.is_installed]
-        if len(installed_frameworks) == 0:
+        num_installed = sum(1 for framework in self.frameworks.values() if framework.is_installed)
+        if num_installed == 0:
             return self.NOT_INSTALLED
-        if len(installed_frameworks) == len(self.frameworks):
+        if num_installed == len(self.frameworks):
             return self.FULLY_INSTALLED
         return self.PARTIALLY_INSTALLED
 
     def install_category_parser(self, parser):
         """Install category parser and get frameworks"""
         if not self.has_frameworks():
-            logging.debug("Skipping {} having no framework".format(self.name))
+            logger.debug("Skipping %s having no framework", self.name)
             return
         # framework parser is directly category parser
         if self.is_main_category:
@@ -132,7 +138,13 @@ class BaseCategory():
                 UI.return_main_screen(status_code=2)
             self.default_framework.run_for(args)
             return
-        self.frameworks[args.framework].run_for(args)
+        framework = self.frameworks.get(args.framework)
+        if framework is None:
+            message = _("Framework {} doesn't exist in category {}").format(args.framework, self.name)
+            logger.error(message)
+            UI.return_main_screen(status_code=2)
+            return
+        framework.run_for(args)
 
 
 class BaseFramework(metaclass=abc.ABCMeta):
@@ -146,31 +158,38 @@ class BaseFramework(metaclass=abc.ABCMeta):
         self.logo_path = None
         self.category = category
         self.is_category_default = is_category_default
-        self.only_on_archs = [] if only_on_archs is None else only_on_archs
+        self.only_on_archs = frozenset(only_on_archs or ())
         self.only_ubuntu = only_ubuntu
-        self.only_ubuntu_version = [] if only_ubuntu_version is None else only_ubuntu_version
+        self.only_ubuntu_version = frozenset(only_ubuntu_version or ())
         self.packages_requirements = [] if packages_requirements is None else packages_requirements
         self.packages_requirements.extend(self.category.packages_requirements)
         self.only_for_removal = only_for_removal
         self.expect_license = expect_license
         # self.override_install_path = "" if override_install_path is None else override_install_path
 
+        if not install_path_dir:
+            install_path_dir = category.install_path_dir_prefix + self.prog_name
+        self.default_install_path = os.path.join(DEFAULT_INSTALL_TOOLS_PATH, install_path_dir)
+        self.default_binary_link_path = DEFAULT_BINARY_LINK_PATH
+        self.install_path = self.default_install_path
+        # check if we have an install path previously set
+        config_install_path = self._get_config_install_path()
+        if config_install_path is not None:
+            self.install_path = config_install_path
+
         # don't detect anything for completion mode (as we need to be quick), so avoid opening apt cache and detect
         # if it's installed.
         if is_completion_mode():
             # only show it in shell completion if it was already installed
             if self.only_for_removal:
-                config = ConfigHandler().config
-                try:
-                    if not os.path.isdir(config["frameworks"][category.prog_name][self.prog_name]["path"]):
-                        # don't show the framework in shell completion as for removal only and not installed
-                        return
-                except (TypeError, KeyError, FileNotFoundError):
+                if config_install_path is None or not os.path.isdir(config_install_path):
                     # don't show the framework in shell completion as for removal only and not installed
                     return
             category.register_framework(self)
             return
 
+        # only import the requirements handler (and so, apt) when not in completion mode
+        from umake.network.requirements_handler import RequirementsHandler
         self.need_root_access = need_root_access
         if not need_root_access:
             with suppress(KeyError):
@@ -185,23 +204,11 @@ class BaseFramework(metaclass=abc.ABCMeta):
                              "Don't set any as default".format(category.name, name,
                                                                self.category.default_framework.name))
                 self.is_category_default = False
-                self.category.default_framework.is_category_default = False
-
-        if not install_path_dir:
-            install_path_dir = os.path.join("" if category.is_main_category else category.prog_name, self.prog_name)
-        self.default_install_path = os.path.join(DEFAULT_INSTALL_TOOLS_PATH, install_path_dir)
-        self.default_binary_link_path = DEFAULT_BINARY_LINK_PATH
-        self.install_path = self.default_install_path
-        # check if we have an install path previously set
-        config = ConfigHandler().config
-        try:
-            self.install_path = config["frameworks"][category.prog_name][self.prog_name]["path"]
-        except (TypeError, KeyError, FileNotFoundError):
-            pass
+                self.category.unset_default_framework()
 
         # This requires install_path and will register need_root or not
         if not force_loading and not self.is_installed and not self.is_installable:
-            logger.info("Don't register {} as it's not installable on this configuration.".format(name))
+            logger.info("Don't register %s as it's not installable on this configuration.", name)
             return
 
         category.register_framework(self)
@@ -211,35 +218,44 @@ class BaseFramework(metaclass=abc.ABCMeta):
         """Return if the framework can be installed on that arch"""
         if self.only_for_removal:
             return False
+        # don't open the apt cache nor detect the platform in completion mode
+        if is_completion_mode():
+            return True
+        from umake.network.requirements_handler import RequirementsHandler
         try:
-            if len(self.only_on_archs) > 0:
+            if self.only_on_archs:
                 # we have some restricted archs, check we support it
                 current_arch = get_current_arch()
                 if current_arch not in self.only_on_archs:
-                    logger.debug("{} only supports {} archs and you are on {}.".format(self.name, self.only_on_archs,
-                                                                                       current_arch))
+                    logger.debug("%s only supports %s archs and you are on %s.", self.name, self.only_on_archs,
+                                 current_arch)
                     return False
             if self.only_ubuntu:
                 # set framework installable only on ubuntu
                 if get_current_distro_id() != "ubuntu":
                     return False
-            if len(self.only_ubuntu_version) > 0:
+            if self.only_ubuntu_version:
                 current_version = get_current_distro_version()
                 if current_version not in self.only_ubuntu_version:
-                    logger.debug("{} only supports {} and you are on {}.".format(self.name, self.only_ubuntu_version,
-                                                                                 current_version))
+                    logger.debug("%s only supports %s and you are on %s.", self.name, self.only_ubuntu_version,
+                                 current_version)
                     return False
             if not RequirementsHandler().is_bucket_available(self.packages_requirements):
                 return False
-        except:
-            logger.error("An error occurred when detecting platform, don't register {}".format(self.name))
+        except (PlatformDetectionError, subprocess.CalledProcessError, OSError, KeyError) as e:
+            logger.error("An error occurred when detecting platform, don't register %s: %s", self.name, e)
             return False
         return True
 
     @property
-    def prog_name(self):
-        """Get programmatic, path and CLI compatible names"""
-        return self.name.lower().replace('/', '-').replace(' ', '-')
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        """Set name and its programmatic, path and CLI compatible counterpart"""
+        self._name = name
+        self.prog_name = name.lower().translate(_PROG_NAME_TRANS)
 
     @abc.abstractmethod
     def setup(self):
@@ -270,25 +286,38 @@ class BaseFramework(metaclass=abc.ABCMeta):
             logger.error(_("You can't remove {} as it isn't installed".format(self.name)))
             UI.return_main_screen(status_code=2)
 
+    def _get_config_install_path(self):
+        """Return the install path saved in the config for this framework, None if there is none"""
+        config = ConfigHandler().config
+        try:
+            return config["frameworks"][self.category.prog_name][self.prog_name]["path"]
+        except (TypeError, KeyError):
+            return None
+
     def mark_in_config(self):
         """Mark the installation as installed in the config file"""
-        config = ConfigHandler().config
-        config.setdefault("frameworks", {})\
-              .setdefault(self.category.prog_name, {})\
-              .setdefault(self.prog_name, {})["path"] = self.install_path
-        ConfigHandler().config = config
+        config_handler = ConfigHandler()
+        config = config_handler.config
+        category_config = config.setdefault("frameworks", {}).setdefault(self.category.prog_name, {})
+        category_config.setdefault(self.prog_name, {})["path"] = self.install_path
+        config_handler.config = config
 
     def remove_from_config(self):
         """Remove current framework from config"""
-        config = ConfigHandler().config
+        config_handler = ConfigHandler()
+        config = config_handler.config
         del(config["frameworks"][self.category.prog_name][self.prog_name])
-        ConfigHandler().config = config
+        config_handler.config = config
 
     @property
     def is_installed(self):
         """Method call to know if the framework is installed"""
         if not os.path.isdir(self.install_path):
             return False
+        # don't open the apt cache in completion mode
+        if is_completion_mode():
+            return True
+        from umake.network.requirements_handler import RequirementsHandler
         if not RequirementsHandler().is_bucket_installed(self.packages_requirements):
             return False
         return True
@@ -310,7 +339,7 @@ class BaseFramework(metaclass=abc.ABCMeta):
 
     def run_for(self, args):
         """Running commands from args namespace"""
-        logger.debug("Call run_for on {}".format(self.name))
+        logger.debug("Call run_for on %s", self.name)
         if args.remove:
             if args.destdir:
                 message = "You can't specify a destination dir while removing a framework"
@@ -338,32 +367,39 @@ class MainCategory(BaseCategory):
         super().__init__(name="main", is_main_category=True)
 
 
-def _is_categoryclass(o):
-    return inspect.isclass(o) and issubclass(o, BaseCategory)
-
-
-def _is_frameworkclass(o):
-    """Filter concrete (non-abstract) subclasses of BaseFramework."""
-    return inspect.isclass(o) and issubclass(o, BaseFramework) and not inspect.isabstract(o)
-
-
-def load_module(module_abs_name, main_category, force_loading):
-    logger.debug("New framework module: {}".format(module_abs_name))
+def load_module(module_abs_name, main_category, force_loading, force_reload=False):
+    logger.debug("New framework module: %s", module_abs_name)
     if module_abs_name not in sys.modules:
         import_module(module_abs_name)
-    else:
+    elif force_reload:
         reload(sys.modules[module_abs_name])
     module = sys.modules[module_abs_name]
+    # collect categories and concrete (non-abstract) frameworks in a single pass, sorted by name as registration order
+    # drives frameworks listing and which one wins on duplicated names
+    category_classes, framework_classes = [], []
+    for name, obj in sorted(vars(module).items()):
+        if not isinstance(obj, type):
+            continue
+        if issubclass(obj, BaseCategory) and obj is not BaseCategory:
+            category_classes.append((name, obj))
+        elif issubclass(obj, BaseFramework) and not inspect.isabstract(obj):
+            framework_classes.append((name, obj))
     current_category = main_category  # if no category found -> we assign to main category
-    for category_name, CategoryClass in inspect.getmembers(module, _is_categoryclass):
-        logger.debug("Found category: {}".format(category_name))
+    for category_name, CategoryClass in category_classes:
+        logger.debug("Found category: %s", category_name)
         current_category = CategoryClass()
     # if we didn't register the category: escape the framework registration
     if current_category not in BaseCategory.categories.values():
         return
-    for framework_name, FrameworkClass in inspect.getmembers(module, _is_frameworkclass):
+    for framework_name, FrameworkClass in framework_classes:
         if FrameworkClass(category=current_category, force_loading=force_loading) is not None:
-            logger.debug("Attach framework {} to {}".format(framework_name, current_category.name))
+            logger.debug("Attach framework %s to %s", framework_name, current_category.name)
+
+
+def _get_system_framework_modules():
+    """Return system framework module names, per module short name, found next to this package"""
+    return {module_name: "{}.{}".format(__package__, module_name)
+            for loader, module_name, ispkg in pkgutil.iter_modules(path=[os.path.dirname(__file__)])}
 
 
 def list_frameworks():
@@ -418,8 +454,17 @@ def list_frameworks():
     return categories_dict
 
 
-def load_frameworks(force_loading=False, load_user_frameworks=True):
-    """Load all modules and assign to correct category"""
+def load_frameworks(force_loading=False, load_user_frameworks=True, force_reload=False, requested_category=None):
+    """Load all modules and assign to correct category
+
+    This is only done once, unless force_reload is set: modules are then discovered again and reloaded if already
+    imported.
+    If requested_category is set and a system frameworks module named after it provides that category, other system
+    frameworks modules aren't loaded."""
+    global _loaded
+    if _loaded and not force_reload:
+        return
+    _loaded = True
     main_category = MainCategory()
 
     # Prepare local paths (1. environment path, 2. local path, 3. system paths).
@@ -434,7 +479,11 @@ def load_frameworks(force_loading=False, load_user_frameworks=True):
 
     if load_user_frameworks:
         for loader, module_name, ispkg in pkgutil.iter_modules(path=local_paths):
-            load_module(module_name, main_category, force_loading)
-    for loader, module_name, ispkg in pkgutil.iter_modules(path=[os.path.dirname(__file__)]):
-        module_name = "{}.{}".format(__package__, module_name)
-        load_module(module_name, main_category, force_loading)
+            load_module(module_name, main_category, force_loading, force_reload)
+    system_modules = _get_system_framework_modules()
+    if requested_category in system_modules:
+        load_module(system_modules.pop(requested_category), main_category, force_loading, force_reload)
+        if requested_category in BaseCategory.categories:
+            return
+    for module_name in system_modules.values():
+        load_module(module_name, main_category, force_loading, force_reload)
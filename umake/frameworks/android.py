@@ -181,7 +181,7 @@ class AndroidNDK(umake.frameworks.baseinstaller.BaseInstaller):
 
     def __init__(self, **kwargs):
         super().__init__(name="Android NDK", description=_("Android NDK"),
-                         only_on_archs='amd64', expect_license=True,
+                         only_on_archs=['amd64'], expect_license=True,
                          download_page="https://developer.android.com/ndk/downloads",
                          packages_requirements=['clang'],
                          dir_to_decompress_in_tarball="android-ndk-*",
@@ -33,7 +33,6 @@ import umake.frameworks
 from umake.decompressor import Decompressor
 from umake.interactions import InputText, YesNo, LicenseAgreement, DisplayMessage, UnknownProgress
 from umake.network.download_center import DownloadCenter, DownloadItem
-from umake.network.requirements_handler import RequirementsHandler
 from umake.ui import UI
 from umake.settings import DEFAULT_INSTALL_TOOLS_PATH
 from umake.tools import MainLoop, strip_tags, launcher_exists, get_icon_path, get_launcher_path, \
@@ -321,6 +320,7 @@ class BaseInstaller(umake.frameworks.BaseFramework):
         self._download_done_callback_called = False
         UI.display(DisplayMessage("Downloading and installing requirements"))
         self.pbar = ProgressBar().start()
+        from umake.network.requirements_handler import RequirementsHandler
         self.pkg_to_install = RequirementsHandler().install_bucket(self.packages_requirements,
                                                                    self.get_progress_requirement,
                                                                    self.requirement_done)
@@ -368,6 +368,7 @@ class BaseInstaller(umake.frameworks.BaseFramework):
     def get_progress_requirement(self, status):
         """Chain up to main get_progress, returning current value between 0 and 100"""
 
+        from umake.network.requirements_handler import RequirementsHandler
         percentage = status["percentage"]
         # 60% is download, 40% is installing
         if status["step"] == RequirementsHandler.STATUS_DOWNLOADING:
@@ -45,6 +45,9 @@ class RequirementsHandler(object, metaclass=Singleton):
     RequirementsResult = namedtuple("RequirementsResult", ["bucket", "error"])
 
     def __init__(self):
+        # buckets status are only valid for a given apt cache state, keyed by frozenset(bucket)
+        self._installed_buckets_status = {}
+        self._available_buckets_status = {}
         logger.info("Create a new apt cache")
         self.cache = apt.Cache()
         self.executor = futures.ThreadPoolExecutor(max_workers=1)
@@ -53,10 +56,42 @@ class RequirementsHandler(object, metaclass=Singleton):
         self.jre_installed_version = None
         self.jdk_installed_version = None
 
+    @property
+    def cache(self):
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache):
+        """Set apt cache, invalidating buckets status each time it's (re)opened"""
+        self._cache = cache
+        cache.connect("cache_post_open", self._invalidate_buckets_status)
+        self._invalidate_buckets_status()
+
+    def _invalidate_buckets_status(self):
+        """Forget any computed buckets status, as the apt cache changed"""
+        self._installed_buckets_status.clear()
+        self._available_buckets_status.clear()
+
     def is_bucket_installed(self, bucket):
         """Check if the bucket is installed
 
         The bucket is a list of packages to check if installed."""
+        key = frozenset(bucket)
+        with suppress(KeyError):
+            (is_installed, resolved_bucket) = self._installed_buckets_status[key]
+            # replay the alternative packages (foo | bar) selection
+            bucket[:] = resolved_bucket
+            return is_installed
+        is_installed = self._is_bucket_installed(bucket)
+        self._installed_buckets_status[key] = (is_installed, list(bucket))
+        # an installed bucket is available: spare another apt cache walk when checking if it's installable. Buckets
+        # with alternatives may select a different package when checked for availability, so keep them out.
+        if is_installed and key == frozenset(bucket):
+            self._available_buckets_status.setdefault(key, (True, list(bucket)))
+        return is_installed
+
+    def _is_bucket_installed(self, bucket):
+        """Check against the apt cache if the bucket is installed"""
         logger.debug("Check if {} is installed".format(bucket))
         is_installed = True
         for pkg_name in bucket:
@@ -83,6 +118,18 @@ class RequirementsHandler(object, metaclass=Singleton):
 
     def is_bucket_available(self, bucket):
         """Check if bucket available on the platform"""
+        key = frozenset(bucket)
+        with suppress(KeyError):
+            (all_in_cache, resolved_bucket) = self._available_buckets_status[key]
+            # replay the alternative packages (foo | bar) selection
+            bucket[:] = resolved_bucket
+            return all_in_cache
+        all_in_cache = self._is_bucket_available(bucket)
+        self._available_buckets_status[key] = (all_in_cache, list(bucket))
+        return all_in_cache
+
+    def _is_bucket_available(self, bucket):
+        """Check against the apt cache if bucket available on the platform"""
         all_in_cache = True
         for pkg_name in bucket:
             if ' | ' in pkg_name:
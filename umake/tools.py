@@ -20,6 +20,7 @@
 from collections import namedtuple
 from contextlib import contextmanager, suppress
 from enum import unique, Enum
+from functools import lru_cache
 from gettext import gettext as _
 from gi.repository import GLib, Gio
 from glob import glob
@@ -28,12 +29,14 @@ import os
 import re
 import shutil
 import signal
+import stat
 import subprocess
 import sys
 from textwrap import dedent
 from time import sleep
 from threading import Lock
 from umake import settings
+import uuid
 from xdg.BaseDirectory import load_first_config, xdg_config_home, xdg_data_home
 import yaml
 import yaml.scanner
@@ -102,31 +105,34 @@ class ConfigHandler(metaclass=Singleton):
 
     @config.setter
     def config(self, config):
-        config_file = os.path.join(xdg_config_home, settings.CONFIG_FILENAME)
+        # follow symlinks so that we update the target (like a managed dotfile) instead of replacing the link
+        config_file = os.path.realpath(os.path.join(xdg_config_home, settings.CONFIG_FILENAME))
         logging.debug("Saving new configuration: {} in {}".format(config, config_file))
-        os.makedirs(os.path.dirname(config_file), exist_ok=True)
-        with open(config_file, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False)
+        config_dir = os.path.dirname(config_file)
+        os.makedirs(config_dir, exist_ok=True)
+        try:
+            mode = stat.S_IMODE(os.stat(config_file).st_mode)
+        except FileNotFoundError:
+            mode = None
+        # write in a separate file first so that we never leave a truncated configuration behind. A new configuration
+        # is created as 0o666 for the kernel to apply the current umask, an existing one keeps its permissions.
+        new_config_file = os.path.join(config_dir, ".{}.{}".format(settings.CONFIG_FILENAME, uuid.uuid4().hex))
+        fd = os.open(new_config_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+        try:
+            with open(fd, 'w') as f:
+                yaml.dump(config, f, default_flow_style=False)
+                f.flush()
+                os.fsync(f.fileno())
+            if mode is not None:
+                os.chmod(new_config_file, mode)
+            os.replace(new_config_file, config_file)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.unlink(new_config_file)
+            raise
         self._config = config
 
 
-class NoneDict(dict):
-    """We don't use a defaultdict(lambda: None) as it's growing every time something is requested"""
-
-    def __getitem__(self, key):
-        return dict.get(self, key)
-
-
-class classproperty(object):
-    """Class property, similar to instance properties"""
-
-    def __init__(self, f):
-        self.f = f
-
-    def __get__(self, obj, owner):
-        return self.f(owner)
-
-
 class MainLoop(object, metaclass=Singleton):
     """Mainloop simple wrapper"""
 
@@ -171,6 +177,10 @@ class MainLoop(object, metaclass=Singleton):
         """Exception raised only to return to MainLoop without finishing the function"""
 
 
+class PlatformDetectionError(Exception):
+    """Exception raised when the current platform (distribution, version) can't be detected"""
+
+
 class InputError(BaseException):
     """Exception raised for errors in the input.
 
@@ -226,20 +236,30 @@ def add_foreign_arch(new_arch):
     return arch_added
 
 
+@lru_cache(maxsize=1)
+def _get_os_release_lines(os_release_path):
+    """Return os-release file stripped lines. Shouldn't change in the life of the process"""
+    with open(os_release_path) as os_release_file:
+        return tuple(line.strip() for line in os_release_file)
+
+
+def _get_current_os_release_lines():
+    """Return current os-release file lines or raise an error if we can't read it"""
+    try:
+        return _get_os_release_lines(settings.OS_RELEASE_FILE)
+    except (FileNotFoundError, IOError) as e:
+        message = "Can't open os-release file: {}".format(e)
+        logger.error(message)
+        raise PlatformDetectionError(message)
+
+
 def get_current_distro_id():
     global _id
     if _id is None:
-        try:
-            with open(settings.OS_RELEASE_FILE) as os_release_file:
-                for line in os_release_file:
-                    line = line.strip()
-                    if line.startswith('ID='):
-                        _id = line.split('=')[1]
-                        break
-        except (FileNotFoundError, IOError) as e:
-            message = "Can't open os-release file: {}".format(e)
-            logger.error(message)
-            raise BaseException(message)
+        for line in _get_current_os_release_lines():
+            if line.startswith('ID='):
+                _id = line.split('=')[1]
+                break
     return _id
 
 
@@ -247,24 +267,17 @@ def get_current_distro_version(distro_name="ubuntu"):
     """Return current ubuntu version or raise an error if couldn't find any"""
     global _version
     if _version is None:
-        try:
-            with open(settings.OS_RELEASE_FILE) as os_release_file:
-                for line in os_release_file:
-                    line = line.strip()
-                    if line.startswith('ID='):
-                        if line != "ID={}".format(distro_name):
-                            break
-                    if line.startswith('VERSION_ID='):
-                        _version = line.split('=')[1].split('"')[1]
-                        break
-                else:
-                    message = "Couldn't find DISTRIB_RELEASE in {}".format(settings.OS_RELEASE_FILE)
-                    logger.error(message)
-                    raise BaseException(message)
-        except (FileNotFoundError, IOError) as e:
-            message = "Can't open os-release file: {}".format(e)
+        for line in _get_current_os_release_lines():
+            if line.startswith('ID='):
+                if line != "ID={}".format(distro_name):
+                    break
+            if line.startswith('VERSION_ID='):
+                _version = line.split('=')[1].split('"')[1]
+                break
+        else:
+            message = "Couldn't find DISTRIB_RELEASE in {}".format(settings.OS_RELEASE_FILE)
             logger.error(message)
-            raise BaseException(message)
+            raise PlatformDetectionError(message)
     return _version
 
 
@@ -89,10 +89,8 @@ class CliUI(UI):
 def run_command_for_args(args):
     """Run correct command for args"""
     # args.category can be a category or a framework in main
-    target = None
-    try:
-        target = BaseCategory.categories[args.category]
-    except AttributeError:
+    target = BaseCategory.categories.get(args.category)
+    if target is None:
         target = BaseCategory.main_category.frameworks[args.category]
     target.run_for(args)
 